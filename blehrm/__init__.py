@@ -12,7 +12,7 @@ from .interface import BlehrmClientInterface
 from . import UUIDS
 from . import clients
 
-from .registry import DeviceNotSupportedError
+from .registry import DeviceNotSupportedError, provides
 
 from typing import List, Tuple
 from bleak import BLEDevice
@@ -35,12 +35,10 @@ class Blehrm:
             return
         
         headers = ["Name", "Services"]
-        table_data = []
-        for name in sensor_names:
-            services = BlehrmRegistry.get_device_services(name)
-            services_str = ", ".join([s for s, available in services.items() if available])
-
-            table_data.append([name, services_str])
+        table_data = (
+            (name, ", ".join(s for s, available in BlehrmRegistry.get_device_services(name).items() if available))
+            for name in sensor_names
+        )
 
         print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
     
@@ -64,15 +62,11 @@ class Blehrm:
             return
 
         headers = ["Name", "Address", "Type", "Services"]
-        table_data = []
-
-        for device, device_type in supported_devices:
-            name = device.name if device.name else "N/A"
-            address = device.address
-            services = BlehrmRegistry.get_device_services(device_type)
-            services_str = ", ".join([s for s, available in services.items() if available])
-
-            table_data.append([name, address, device_type, services_str])
+        table_data = (
+            (device.name or "N/A", device.address, device_type,
+             ", ".join(s for s, available in BlehrmRegistry.get_device_services(device_type).items() if available))
+            for device, device_type in supported_devices
+        )
 
         print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
 
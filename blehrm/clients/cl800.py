@@ -1,9 +1,10 @@
 from blehrm.interface import BlehrmClientInterface
-from blehrm.registry import BlehrmRegistry
+from blehrm.registry import BlehrmRegistry, provides
 import time
 import numpy as np
 
-@BlehrmRegistry.register("CL800")
+@BlehrmRegistry.register("CL800", name_patterns=("CL800",))
+@provides('ibi', 'acc')
 class CL800Client(BlehrmClientInterface):
     
     ## ACCELEROMETER SERVCIE
@@ -18,14 +19,10 @@ class CL800Client(BlehrmClientInterface):
     def __init__(self, ble_device):
         super().__init__(ble_device)
 
-    @staticmethod
-    def is_supported(device_name: str) -> bool:
-        return device_name is not None and "CL800" in device_name
-    
     def _ibi_data_processor(self, data: bytearray) -> np.ndarray:
         if len(data) < 2:
-            self.logger.warning(f"Received data is too short: {data}")
-            return np.array([])
+            self.logger.warning("Received data is too short: %s", bytes(data))
+            return np.empty((0, 2), dtype=np.float64)
 
         byte0 = data[0]  # heart rate format
         uint8_format = (byte0 & 1) == 0
@@ -34,7 +31,7 @@ class CL800Client(BlehrmClientInterface):
 
         if not rr_interval:
             self.logger.warning("No RR interval data present")
-            return np.array([])
+            return np.empty((0, 2), dtype=np.float64)
 
         first_rr_byte = 2
         try:
@@ -48,8 +45,8 @@ class CL800Client(BlehrmClientInterface):
                 first_rr_byte += 2
 
             if first_rr_byte >= len(data):
-                self.logger.warning(f"No IBI data present after HR and flags: {data}")
-                return np.array([])
+                self.logger.warning("No IBI data present after HR and flags: %s", bytes(data))
+                return np.empty((0, 2), dtype=np.float64)
 
             sample_data = []
             for i in range(first_rr_byte, len(data) - 1, 2):
@@ -64,13 +61,13 @@ class CL800Client(BlehrmClientInterface):
 
             if not sample_data:
                 self.logger.warning("No valid IBI data processed")
-                return np.array([])
+                return np.empty((0, 2), dtype=np.float64)
 
             return np.array(sample_data)
 
         except Exception as e:
             self.logger.error(f"Error processing IBI data: {e}")
-            return np.array([])
+            return np.empty((0, 2), dtype=np.float64)
 
     async def start_acc_stream(self, callback):
         self.set_acc_callback(callback)
@@ -92,7 +89,7 @@ class CL800Client(BlehrmClientInterface):
         Accelerometer values are 16 bit 
         ''' 
         if len(data) < 3:
-            self.logger.warning(f"Received data is too short: {data}")
+            self.logger.warning("Received data is too short: %s", bytes(data))
             return np.array([])
 
         prefix = data[0:3]
@@ -1,53 +1,60 @@
 from ..interface import BlehrmClientInterface
-from ..registry import BlehrmRegistry
+from ..registry import BlehrmRegistry, provides
 import time
 import numpy as np
 
-@BlehrmRegistry.register("GarminHRMPro")
+@BlehrmRegistry.register("GarminHRMPro", name_patterns=("HRM-Pro",))
+@provides('ibi')
 class GarminHRMProClient(BlehrmClientInterface):
     
-    def __init__(self, ble_device):
+    def __init__(self, ble_device, include_hr: bool = False):
         super().__init__(ble_device)
+        # Garmin-specific: append heart rate in bpm as a third column of the ibi data,
+        # extending the interface's (N, 2) result. Off by default.
+        self.include_hr = include_hr
+        # Wall clock origin, advanced with the monotonic clock to timestamp samples
+        self._t0_wall_ns = time.time_ns()
+        self._t0_perf_ns = time.perf_counter_ns()
     
-    @staticmethod
-    def is_supported(device_name):
-        return device_name is not None and "HRM-Pro" in device_name
-
     def _ibi_data_processor(self, data):
         """
         Process IBI data from Garmin HRM-Pro.
         Args:
-            data: bytearray of the ibi to be processed
+            data: memoryview of the ibi bytes to be processed
         Returns:
             ndarray of where each row is a datapoint [epoch time in s, interbeat interval in milliseconds]
-            Returns an empty array if no IBI data is present
+            with a third column of heart rate in bpm (NaN for a zero IBI) if include_hr is set
+            Returns an empty array with no rows if no IBI data is present
         """
 
         if len(data) < 2:
-            return np.array([])
+            return np.empty((0, 3 if self.include_hr else 2), dtype=np.float64)
 
         flags = data[0]
         hr_format = flags & 0x01
         has_ibi = (flags >> 4) & 0x01
 
         if not has_ibi:
-            # print(f"No IBI data present. Flags: {flags:08b}")
-            return np.array([])
+            self.logger.debug("No IBI data present. Flags: 0x%02x", flags)
+            return np.empty((0, 3 if self.include_hr else 2), dtype=np.float64)
 
         ibi_start = 2 if hr_format == 0 else 3
-        ibis = []
-        sample_time = time.time()
+        sample_time_ns = self._t0_wall_ns + (time.perf_counter_ns() - self._t0_perf_ns)
 
-        for i in range(ibi_start, len(data), 2):
-            if i + 1 < len(data):
-                ibi = (data[i + 1] << 8) | data[i]
-                ibis.append(ibi)
+        n_ibis = (len(data) - ibi_start) // 2
 
-        if not ibis:
-            print(f"No IBI values extracted. Data length: {len(data)}, IBI start: {ibi_start}")
-            return np.array([])
+        if n_ibis <= 0:
+            self.logger.warning("No IBI values extracted. Data length: %d, IBI start: %d", len(data), ibi_start)
+            return np.empty((0, 3 if self.include_hr else 2), dtype=np.float64)
 
+        # IBIs are little-endian uint16 in 1/1024 seconds
+        ibis = np.frombuffer(data, dtype='<u2', offset=ibi_start, count=n_ibis)
+        out = np.empty((n_ibis, 3 if self.include_hr else 2), dtype=np.float64)
+        out[:, 0] = sample_time_ns * 1e-9
         # Convert IBI values from 1/1024 seconds to milliseconds
-        ibis_ms = [ibi * 1000 / 1024 for ibi in ibis]
+        np.multiply(ibis, 1000 / 1024, out=out[:, 1])
+        if self.include_hr:
+            out[:, 2] = np.nan
+            np.divide(60000.0, out[:, 1], out=out[:, 2], where=out[:, 1] > 0)
 
-        return np.array([[sample_time, ibi_ms] for ibi_ms in ibis_ms])
\ No newline at end of file
+        return out
\ No newline at end of file
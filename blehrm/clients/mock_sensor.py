@@ -1,12 +1,13 @@
 from ..interface import BlehrmClientInterface
-from ..registry import BlehrmRegistry
+from ..registry import BlehrmRegistry, provides
 import asyncio
 import random
 import time
 import numpy as np
 import math
 
-@BlehrmRegistry.register("MockSensor")
+@BlehrmRegistry.register("MockSensor", name_patterns=("Mock",))
+@provides('ibi', 'acc')
 class MockSensorClient(BlehrmClientInterface):
     '''
     Mock sensor that simulates rr-interval
@@ -16,10 +17,7 @@ class MockSensorClient(BlehrmClientInterface):
         self.is_connected = False
         self.stream_ibi = False
         self.stream_acc = False
-
-    @staticmethod
-    def is_supported(device_name: str) -> bool:
-        return device_name is not None and "Mock" in device_name
+        self._acc_buf = np.empty((1, 4), dtype=np.float64)
 
     async def connect(self) -> None:
         self.is_connected = True
@@ -41,11 +39,11 @@ class MockSensorClient(BlehrmClientInterface):
         '''
         while self.stream_ibi:
             await asyncio.sleep(random.uniform(0.8, 1.3))
-            callback(np.array([time.time_ns()/1.0e9, random.randint(800, 1300)]))
+            callback(np.array([[time.time_ns()/1.0e9, random.randint(800, 1300)]]))
     
     def _ibi_data_processor(self, data:bytearray) -> np.ndarray:
         ''' Required by the ABC'''
-        return np.array([])
+        return np.empty((0, 2), dtype=np.float64)
 
     async def stop_ibi_stream(self) -> None:
         self.stream_ibi = False
@@ -56,15 +54,16 @@ class MockSensorClient(BlehrmClientInterface):
 
     async def _acc_stream(self, callback) -> None:
         ''' Sine acc data at constant interval
+        Samples are written into a reused buffer and a copy is passed, so callbacks can retain it like real client data
         '''
+        acc_buf = self._acc_buf
         while self.stream_acc:
             await asyncio.sleep(0.01)
-            t = time.time_ns()/1.0e9
-            x = math.sin(2 * math.pi * 0.2 * t)
-            y = math.cos(2 * math.pi * 0.2 * t)
-            z = math.sin(2 * math.pi * 0.1 * t + math.pi/2)
+            t = time.time_ns()*1e-9
+            phase = 2 * math.pi * 0.2 * t
+            acc_buf[0] = (t, math.sin(phase), math.cos(phase), math.cos(phase / 2))
 
-            callback(np.array([t, x, y, z]))
+            callback(acc_buf.copy())
 
     def _acc_data_processor(self, data:bytearray) -> np.ndarray:
         ''' Required by the ABC'''
@@ -1,18 +1,15 @@
 from ..interface import BlehrmClientInterface
-from ..registry import BlehrmRegistry
+from ..registry import BlehrmRegistry, provides
 import time
 import numpy as np
 
-@BlehrmRegistry.register("Movesense")
+@BlehrmRegistry.register("Movesense", name_patterns=("Movesense",))
+@provides('ibi')
 class MovesenseClient(BlehrmClientInterface):
     
     def __init__(self, ble_device):
         super().__init__(ble_device)
     
-    @staticmethod
-    def is_supported(device_name):
-        return device_name is not None and "Movesense" in device_name
-
     def _ibi_data_processor(self, data):
         """
         Process IBI data from Movesense
@@ -20,19 +17,19 @@ class MovesenseClient(BlehrmClientInterface):
             data: bytearray of the ibi to be processed
         Returns:
             ndarray of where each row is a datapoint [epoch time in s, interbeat interval in milliseconds]
-            Returns an empty array if no IBI data is present
+            Returns an empty (0, 2) array if no IBI data is present
         """
 
         if len(data) < 2:
-            return np.array([])
+            return np.empty((0, 2), dtype=np.float64)
 
         flags = data[0]
         hr_format = flags & 0x01
         has_ibi = (flags >> 4) & 0x01
 
         if not has_ibi:
-            # print(f"No IBI data present. Flags: {flags:08b}")
-            return np.array([])
+            self.logger.debug("No IBI data present. Flags: 0x%02x", flags)
+            return np.empty((0, 2), dtype=np.float64)
 
         ibi_start = 2 if hr_format == 0 else 3
         ibis = []
@@ -44,8 +41,8 @@ class MovesenseClient(BlehrmClientInterface):
                 ibis.append(ibi)
 
         if not ibis:
-            print(f"No IBI values extracted. Data length: {len(data)}, IBI start: {ibi_start}")
-            return np.array([])
+            self.logger.warning("No IBI values extracted. Data length: %d, IBI start: %d", len(data), ibi_start)
+            return np.empty((0, 2), dtype=np.float64)
 
         # Convert IBI values from 1/1024 seconds to milliseconds
         ibis_ms = [ibi * 1000 / 1024 for ibi in ibis]
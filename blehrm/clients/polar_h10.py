@@ -1,10 +1,11 @@
 from ..interface import BlehrmClientInterface
-from ..registry import BlehrmRegistry
+from ..registry import BlehrmRegistry, provides
 import time
 import numpy as np
 import math
 
-@BlehrmRegistry.register("PolarH10")
+@BlehrmRegistry.register("PolarH10", name_patterns=("Polar H10",))
+@provides('ibi', 'acc', 'ecg')
 class PolarH10Client(BlehrmClientInterface):
     
     ## UNKNOWN 1 SERVICE
@@ -41,10 +42,6 @@ class PolarH10Client(BlehrmClientInterface):
         self.first_acc_record = True
         self.first_ecg_record = True
     
-    @staticmethod
-    def is_supported(device_name):
-        return device_name is not None and "Polar H10" in device_name
-    
     def _ibi_data_processor(self, data):
         """
         Args:
@@ -75,7 +72,7 @@ class PolarH10Client(BlehrmClientInterface):
 
         if not rr_interval:
             self.logger.warning("No RR interval data present")
-            return np.array([])
+            return np.empty((0, 2), dtype=np.float64)
 
         first_rr_byte = 2
         if uint8_format:
@@ -96,6 +93,9 @@ class PolarH10Client(BlehrmClientInterface):
             ibi = np.ceil(ibi / 1024 * 1000)
             ibis.append(ibi)
 
+        if not ibis:
+            return np.empty((0, 2), dtype=np.float64)
+
         sample_time = time.time_ns()/1.0e9
 
         return np.array([[sample_time, ibi] for ibi in ibis])
@@ -149,6 +149,8 @@ class PolarH10Client(BlehrmClientInterface):
 
             return np.array(sample_data)
 
+        return np.array([])
+
     async def start_ecg_stream(self, callback):
         self.set_ecg_callback(callback)
         await self.bleak_client.write_gatt_char(PolarH10Client.PMD_CHAR1_UUID, PolarH10Client.ECG_WRITE, response=True)
@@ -186,6 +188,7 @@ class PolarH10Client(BlehrmClientInterface):
             
             return np.array(sample_data)
 
+        return np.array([])
 
     @staticmethod
     def convert_array_to_signed_int(data, offset, length):
@@ -2,25 +2,45 @@ from abc import ABC, abstractmethod
 from bleak import BLEDevice, BleakClient
 from blehrm.UUIDS import (HEART_RATE_MEASUREMENT_UUID, MANUFACTURER_NAME_UUID, 
                    MODEL_NBR_UUID, BATTERY_LEVEL_UUID)
-from typing import Callable, Union, Any, Optional
+from typing import Callable, Union, Any, Optional, Deque, Tuple
+from collections import deque
 import numpy as np
+import asyncio
 import logging
 
+# Callbacks receive the (N, M) ndarray produced from one notification, one row per data point
 DataCallback = Callable[[np.ndarray], None]
 
+def _noop(_: np.ndarray) -> None:
+    """Default callback until one is set with set_*_callback"""
+    pass
+
 class BlehrmClientInterface(ABC):
     """Abstract base class for sensor client.
 
     This class defines the interface for interacting with various ECG chest strap sensors.
-    Two methods required at minimum:
-        is_supported
+    One method required at minimum:
         _ibi_data_processor
 
+    is_supported defaults to matching the name_patterns passed to BlehrmRegistry.register,
+    override it for other device name rules.
+
     To support acc (or ecg) streaming, implement:
         start_acc_stream (or start_ecg_stream)
         stop_acc_stream (or stop_ecg_stream)
         _acc_data_processor (or _ecg_data_processor)
+
+    The _*_data_processor methods receive a memoryview over the bytearray from bleak,
+    so the raw bytes can be consumed without copying (e.g. with np.frombuffer).
+
+    _ibi_data_handler only queues notifications for a worker task. Overrides of
+    start_ibi_stream (or stop_ibi_stream) that register _ibi_data_handler with
+    start_notify must call _start_ibi_worker first (or _stop_ibi_worker after).
     """
+    IBI_QUEUE_LEN = 256
+    # Set by BlehrmRegistry.register
+    _name_patterns: Tuple[str, ...] = ()
+
     def __init__(self, ble_device: Union[BLEDevice, str]):
         """Initialize the sensor client.
 
@@ -28,65 +48,81 @@ class BlehrmClientInterface(ABC):
             ble_device: The BLEDevice (bleak)
         """
         self.ble_device = ble_device
-        self._ibi_callback: Optional[DataCallback] = None
-        self._acc_callback: Optional[DataCallback] = None
-        self._ecg_callback: Optional[DataCallback] = None
+        self.bleak_client: Optional[BleakClient] = None
+        self._ibi_callback: DataCallback = _noop
+        self._acc_callback: DataCallback = _noop
+        self._ecg_callback: DataCallback = _noop
+        self.model_number_str: Optional[str] = None
+        self.manufacturer_name_str: Optional[str] = None
+        self._ibi_queue: Deque[bytes] = deque(maxlen=self.IBI_QUEUE_LEN)
+        self._ibi_event: Optional[asyncio.Event] = None
+        self._ibi_worker_task: Optional[asyncio.Task] = None
+        self._ibi_dropped = 0
         self.logger = logging.getLogger(__name__)
 
-    @staticmethod
-    @abstractmethod
-    def is_supported(device_name: str) -> bool:
+    @classmethod
+    def is_supported(cls, device_name: Optional[str]) -> bool:
         """Check if the device is supported by this sensor client.
 
+        By default checks whether any of the class's registered name patterns is in device_name.
+
         Args:
             device_name: The name of the device to check.
 
         Returns:
             True if the device is supported, False otherwise.
         """
-        pass
+        return device_name is not None and any(pattern in device_name for pattern in cls._name_patterns)
 
     async def connect(self) -> None:
         """Connect to the bleak BLE device.
 
+        bleak_client is only set once the connection succeeds. Errors are not caught,
+        callers should handle them (e.g. to retry the connection).
+
         Raises:
             Exception: If connection fails.
         """
-        try:
-            self.bleak_client = BleakClient(self.ble_device)
-            await self.bleak_client.connect()
-            self.logger.info("Connected to device successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to connect: {e}")
+        bleak_client = BleakClient(self.ble_device)
+        await bleak_client.connect()
+        self.bleak_client = bleak_client
+        self.logger.info("Connected to device successfully")
 
     async def disconnect(self) -> None:
-        """Disconnect from the BLE device.
+        """Disconnect from the BLE device. Does nothing if connect has not succeeded.
+
+        Also stops the ibi worker, in case the stream was not stopped first.
 
         Raises:
             Exception: If disconnection fails.
         """
-        try:
-            await self.bleak_client.disconnect()
-            self.logger.info("Disconnected from device successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to disconnect: {e}")
+        await self._stop_ibi_worker()
+        if self.bleak_client is None:
+            return
+        await self.bleak_client.disconnect()
+        self.logger.info("Disconnected from device successfully")
 
     async def get_device_info(self) -> dict:
         """Retrieve device information.
 
         This method reads the model number, manufacturer name, and battery level
-        from the device.
+        from the device. The model number and manufacturer name are decoded once
+        and cached, only the battery level is read on subsequent calls.
 
         Returns:
             A dictionary containing the device information.
         """
-        model_number = await self.bleak_client.read_gatt_char(MODEL_NBR_UUID)
-        manufacturer_name = await self.bleak_client.read_gatt_char(MANUFACTURER_NAME_UUID)
+        if self.model_number_str is None:
+            model_number = await self.bleak_client.read_gatt_char(MODEL_NBR_UUID)
+            self.model_number_str = bytes(model_number).decode('ascii', 'replace')
+        if self.manufacturer_name_str is None:
+            manufacturer_name = await self.bleak_client.read_gatt_char(MANUFACTURER_NAME_UUID)
+            self.manufacturer_name_str = bytes(manufacturer_name).decode('ascii', 'replace')
         battery_level = await self.bleak_client.read_gatt_char(BATTERY_LEVEL_UUID)
         
         return {
-            "model_number": ''.join(map(chr, model_number)),
-            "manufacturer_name": ''.join(map(chr, manufacturer_name)),
+            "model_number": self.model_number_str,
+            "manufacturer_name": self.manufacturer_name_str,
             "battery_level": int(battery_level[0])
         }
 
@@ -104,64 +140,113 @@ class BlehrmClientInterface(ABC):
             f"Manufacturer: {BLUE}{device_info['manufacturer_name']}{RESET}\n"
             f"Battery: {BLUE}{device_info['battery_level']}%{RESET}")
 
-    @property
-    def ibi_callback(self) -> DataCallback:
-        if not self._ibi_callback:
-            raise ValueError('Set the ibi_callback first with set_ibi_callback')
-        else:
-            return self._ibi_callback
-
     def set_ibi_callback(self, callback: DataCallback) -> None:
+        if callback is None:
+            raise ValueError('ibi callback must not be None')
         self._ibi_callback = callback
         
     async def start_ibi_stream(self, callback: Callable[[np.ndarray], None]) -> None:
         """Start streaming interbeat interval data.
 
         Args:
-            callback: Function to call with IBI data. Expects an ndarray from _ibi_data_handler.
-            Function to call with IBI data. Expects a 2-element NumPy array of floats.
+            callback: Function to call with IBI data. Receives an (N, 2) ndarray from _ibi_data_handler,
+            where each row is [epoch time in s, interbeat interval in milliseconds].
         """
         self.set_ibi_callback(callback)
-        await self.bleak_client.start_notify(HEART_RATE_MEASUREMENT_UUID, self._ibi_data_handler)
+        await self._start_ibi_worker()
+        try:
+            await self.bleak_client.start_notify(HEART_RATE_MEASUREMENT_UUID, self._ibi_data_handler)
+        except BaseException:
+            await self._stop_ibi_worker()
+            raise
 
     async def stop_ibi_stream(self) -> None:
         """Stop streaming interbeat interval data."""
-        await self.bleak_client.stop_notify(HEART_RATE_MEASUREMENT_UUID)
+        try:
+            await self.bleak_client.stop_notify(HEART_RATE_MEASUREMENT_UUID)
+        finally:
+            await self._stop_ibi_worker()
+
+    async def _start_ibi_worker(self) -> None:
+        """Start the task consuming notifications queued by _ibi_data_handler, replacing any running one."""
+        await self._stop_ibi_worker()
+        self._ibi_queue.clear()
+        self._ibi_dropped = 0
+        self._ibi_event = asyncio.Event()
+        self._ibi_worker_task = asyncio.create_task(self._ibi_worker())
+
+    async def _stop_ibi_worker(self) -> None:
+        """Cancel the ibi worker task, if running, and wait for it to finish."""
+        task, self._ibi_worker_task = self._ibi_worker_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
         
     def _ibi_data_handler(self, sender: Any, data: bytearray) -> None:
         """Handle heart rate data.
 
+        Queues the data for _ibi_worker, keeping the bleak notify callback short.
+        If the queue is full the oldest notification is dropped, and the
+        drops are counted for _ibi_worker to report.
+        Requires _start_ibi_worker to have been called, as start_ibi_stream does.
+
         Args:
             sender: The sender of the data.
             data: The raw heart rate data.
         """
-        result = self._ibi_data_processor(data)
-        for row in result:
-            if row.ndim > 1:
-                self.logger.warning("More than one IBI data row")
-            self.ibi_callback(row)
+        ibi_queue = self._ibi_queue
+        if len(ibi_queue) == ibi_queue.maxlen:
+            self._ibi_dropped += 1
+        ibi_queue.append(bytes(data))
+        self._ibi_event.set()
+
+    async def _ibi_worker(self) -> None:
+        """Process queued heart rate data and pass the results to the ibi callback.
+
+        The callback is looked up for each result, so set_ibi_callback takes effect mid-stream.
+        """
+        ibi_queue = self._ibi_queue
+        ibi_event = self._ibi_event
+        processor = self._ibi_data_processor
+        while True:
+            await ibi_event.wait()
+            ibi_event.clear()
+            if self._ibi_dropped:
+                self.logger.warning("IBI queue full, dropped %d oldest notifications", self._ibi_dropped)
+                self._ibi_dropped = 0
+            while ibi_queue:
+                data = ibi_queue.popleft()
+                try:
+                    result = processor(memoryview(data))
+                except Exception:
+                    self.logger.exception("Error processing IBI data: %s", data)
+                    continue
+                if result.size:
+                    try:
+                        self._ibi_callback(result)
+                    except Exception:
+                        self.logger.exception("Error in ibi callback")
 
     @abstractmethod
-    def _ibi_data_processor(self, data:bytearray) -> np.ndarray:
-        """ Process sensor byte data, returning 1D numpy array of the result
+    def _ibi_data_processor(self, data: memoryview) -> np.ndarray:
+        """ Process sensor byte data (memoryview), returning numpy array of the result, where each row is a data point
+
+        Must always return a 2D (N, 2) float64 array, [epoch time in s, interbeat interval in milliseconds],
+        including (0, 2) when no IBI data is present, so results can be stacked without reshaping.
         """
         pass
 
-    @property
-    def acc_callback(self) -> DataCallback:
-        if not self._acc_callback:
-            raise ValueError('Set the acc callback first with set_acc_callback')
-        else:
-            return self._acc_callback
-
     def set_acc_callback(self, callback: DataCallback) -> None:
+        if callback is None:
+            raise ValueError('acc callback must not be None')
         self._acc_callback = callback
 
     async def start_acc_stream(self, callback: Callable[[np.ndarray], None]) -> None:
         """Start streaming accelerometer data.
 
         Args:
-            callback: Function to call with accelerometer data.
+            callback: Function to call with accelerometer data. Receives an (N, 4) ndarray,
+            where each row is [epoch time in s, x, y, z].
 
         Raises:
             NotImplementedError: If ACC streaming is not supported.
@@ -183,25 +268,18 @@ class BlehrmClientInterface(ABC):
             sender: The sender of the data.
             data: The raw bytes data from accelerometer.
         """
-        result = self._acc_data_processor(data)
-        for row in result:
-            if row.ndim > 1:
-                self.logger.warning("More than one ACC data row")
-            self.acc_callback(row)
+        result = self._acc_data_processor(memoryview(data))
+        if result.size:
+            self._acc_callback(result)
 
-    def _acc_data_processor(self, data:bytearray) -> np.ndarray:
-        """ Process sensor byte data, returning numpy array of the result, where each row is a data point
+    def _acc_data_processor(self, data: memoryview) -> np.ndarray:
+        """ Process sensor byte data (memoryview), returning numpy array of the result, where each row is a data point
         """
         raise NotImplementedError("ACC streaming is not supported for this sensor")
 
-    @property
-    def ecg_callback(self) -> DataCallback:
-        if not self._ecg_callback:
-            raise ValueError('Set the ecg callback first with set_ecg_callback')
-        else:
-            return self._ecg_callback
-    
     def set_ecg_callback(self, callback: DataCallback) -> None:
+        if callback is None:
+            raise ValueError('ecg callback must not be None')
         self._ecg_callback = callback
 
     async def start_ecg_stream(self) -> None:
@@ -227,13 +305,11 @@ class BlehrmClientInterface(ABC):
             sender: The sender of the data.
             data: The raw bytes ecg data.
         """
-        result = self._ecg_data_processor(data)
-        for row in result:
-            if row.ndim > 1:
-                self.logger.warning("More than one ECG data row")
-            self.ecg_callback(row)
+        result = self._ecg_data_processor(memoryview(data))
+        if result.size:
+            self._ecg_callback(result)
 
-    def _ecg_data_processor(self, data: bytearray) -> np.ndarray:
-        """ Process sensor byte data, returning numpy array of the result, where each row is a data point
+    def _ecg_data_processor(self, data: memoryview) -> np.ndarray:
+        """ Process sensor byte data (memoryview), returning numpy array of the result, where each row is a data point
         """
         raise NotImplementedError("ECG streaming is not supported for this sensor")
@@ -1,6 +1,36 @@
 from .interface import BlehrmClientInterface
-from typing import Dict, Type, List, Tuple, Any, Optional
+from typing import Dict, Type, List, Tuple, Optional
+from dataclasses import dataclass
+import functools
 from bleak import BLEDevice
+import re
+
+@dataclass(frozen=True)
+class _SensorEntry:
+    """Registered sensor class and its device name patterns."""
+    __slots__ = ('cls', 'patterns')
+    cls: Type[BlehrmClientInterface]
+    patterns: Tuple[str, ...]
+
+_SERVICES = frozenset({'ibi', 'acc', 'ecg'})
+
+def provides(*services: str):
+    """Declare the services a sensor class supports, e.g. @provides('acc').
+
+    'ibi' is always included, as every client implements _ibi_data_processor.
+    Classes without it fall back to checking which _*_data_processor methods are overridden.
+
+    Raises:
+        ValueError: If a service is not one of 'ibi', 'acc', 'ecg'.
+    """
+    unknown = set(services) - _SERVICES
+    if unknown:
+        raise ValueError(f"Unknown services {sorted(unknown)}, expected any of {sorted(_SERVICES)}")
+
+    def decorator(sensor_class: Type[BlehrmClientInterface]):
+        sensor_class._blehrm_services = frozenset(services) | {'ibi'}
+        return sensor_class
+    return decorator
 
 class BlehrmRegistry:
     """Registry for available sensors.
@@ -8,11 +38,22 @@ class BlehrmRegistry:
         
         @BlehrmRegistry.register("SensorName")
 
+    Optionally pass the device name substrings the sensor supports, which are matched
+    in a single regex pass instead of calling each class's is_supported:
+
+        @BlehrmRegistry.register("SensorName", name_patterns=("Sensor",))
+
+    Declare the available services with @provides:
+
+        @BlehrmRegistry.register("SensorName")
+        @provides("ibi", "acc")
+
     Methods:
         register
         _is_method_overwritten
         get_registered_sensors
         device_support
+        clear_support_cache
         get_supported_devices
         get_device_class
         get_device_services
@@ -20,10 +61,12 @@ class BlehrmRegistry:
         print_supported_devices
     """
 
-    _sensors: Dict[str, Dict[str, Any]] = {}
+    _sensors: Dict[str, _SensorEntry] = {}
+    _pattern_to_sensor: Dict[str, str] = {}
+    _compiled_patterns: Optional[re.Pattern] = None
 
     @classmethod
-    def register(cls, sensor_name: str):
+    def register(cls, sensor_name: str, name_patterns: Tuple[str, ...] = ()):
         """Register sensors using a decorator.
 
         This method is used as a decorator to register sensor classes in the _sensors dict.
@@ -31,22 +74,40 @@ class BlehrmRegistry:
 
         Args:
             sensor_name: The name of the sensor to register.
+            name_patterns: Substrings of device names supported by the sensor, also used by the
+                default is_supported. If empty, the class's is_supported is called instead.
+                Sensors with patterns are matched before those without. If several patterns
+                match a name, the one found earliest in the name wins, and a pattern declared
+                by more than one sensor belongs to the first registered.
 
         Returns:
             A decorator function that registers the sensor class.
         """
         def decorator(sensor_class: Type[BlehrmClientInterface]):
-            services = {
-                'ibi': hasattr(sensor_class, 'start_ibi_stream'),
-                'acc': cls._is_method_overridden(sensor_class, '_acc_data_processor'),
-                'ecg': cls._is_method_overridden(sensor_class, '_ecg_data_processor')
-            }
-            cls._sensors[sensor_name] = {
-                'class' : sensor_class,
-                'services' : services
-            }
+            sensor_class._name_patterns = tuple(name_patterns)
+            cls._sensors[sensor_name] = _SensorEntry(
+                cls=sensor_class,
+                patterns=tuple(name_patterns)
+            )
+            cls._compiled_patterns = None
+            cls.clear_support_cache()
+            cls._services_for.cache_clear()
             return sensor_class
         return decorator
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _services_for(cls, sensor_name: str) -> Tuple[bool, bool, bool]:
+        """Resolve (ibi, acc, ecg) support for a registered sensor on first use, rather than at import time."""
+        sensor_class = cls._sensors[sensor_name].cls
+        services = getattr(sensor_class, '_blehrm_services', None)
+        if services is not None:
+            return 'ibi' in services, 'acc' in services, 'ecg' in services
+        return (
+            hasattr(sensor_class, 'start_ibi_stream'),
+            cls._is_method_overridden(sensor_class, '_acc_data_processor'),
+            cls._is_method_overridden(sensor_class, '_ecg_data_processor')
+        )
     
     @staticmethod
     def _is_method_overridden(sensor_class: Type[BlehrmClientInterface], method_name: str) -> bool:
@@ -64,17 +125,50 @@ class BlehrmRegistry:
         Returns:
             A list of names (str) of registered sensors.
         """
-        return [s for s in cls._sensors.keys()]
+        return list(cls._sensors)
     
+    @classmethod
+    def _get_compiled_patterns(cls) -> Optional[re.Pattern]:
+        ''' Returns a regex matching any registered name pattern, rebuilt after registration changes
+        '''
+        if cls._compiled_patterns is None:
+            cls._pattern_to_sensor = {}
+            for sensor_name, entry in cls._sensors.items():
+                for pattern in entry.patterns:
+                    # First registered sensor keeps a shared pattern
+                    cls._pattern_to_sensor.setdefault(pattern, sensor_name)
+            if cls._pattern_to_sensor:
+                cls._compiled_patterns = re.compile("|".join(map(re.escape, cls._pattern_to_sensor)))
+        return cls._compiled_patterns
+
     @classmethod
     def device_support(cls, device: BLEDevice) -> Optional[str]:
         ''' Returns the class name of a BLEDevice if it is supported, otherwise returns None
         '''
-        for sensor_class_name, sensor_info in cls._sensors.items():
-            if sensor_info['class'].is_supported(device.name):
+        return cls._support_by_name(device.name)
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _support_by_name(cls, device_name: Optional[str]) -> Optional[str]:
+        ''' Returns the class name supporting device_name, cached since scans repeat the same names
+        '''
+        compiled_patterns = cls._get_compiled_patterns()
+        if compiled_patterns is not None:
+            match = compiled_patterns.search(device_name or "")
+            if match:
+                return cls._pattern_to_sensor[match.group(0)]
+
+        for sensor_class_name, entry in cls._sensors.items():
+            if not entry.patterns and entry.cls.is_supported(device_name):
                 return sensor_class_name
         return None
 
+    @classmethod
+    def clear_support_cache(cls) -> None:
+        ''' Clears cached device_support results, called whenever a sensor is registered
+        '''
+        cls._support_by_name.cache_clear()
+
     @classmethod
     def get_supported_devices(cls, devices: List[BLEDevice]) -> List[Tuple[BLEDevice, str]]:
         """Get supported sensors for given BLEDevices. Support is checked based on device.name
@@ -96,13 +190,14 @@ class BlehrmRegistry:
     def get_device_class(cls, device_type: str) -> BlehrmClientInterface:
         ''' Returns the class of the device with device_type
         '''
-        return cls._sensors[device_type]['class']
+        return cls._sensors[device_type].cls
     
     @classmethod
     def get_device_services(cls, device_type: str) -> Dict[str, bool]:
         ''' Returns the services for the device with device_type
         '''
-        return cls._sensors[device_type]['services']
+        has_ibi, has_acc, has_ecg = cls._services_for(device_type)
+        return {'ibi': has_ibi, 'acc': has_acc, 'ecg': has_ecg}
 
     @classmethod
     def create_client(cls, device: BLEDevice) -> BlehrmClientInterface:
@@ -20,18 +20,35 @@ async def main(record_len):
 
     sensor_clients = [blehrm.create_client(device) for device, _ in supported_sensors]
     
-    logged_data = [[] for _ in sensor_clients]
+    # Preallocated per sensor, sized for HR up to 240 bpm (4 beats per second)
+    # Timestamps and IBIs are kept in separate arrays, float32 keeps the fractional ms of the IBIs
+    logged_t = [np.empty(record_len*4, dtype=np.float64) for _ in sensor_clients]
+    logged_ibi = [np.empty(record_len*4, dtype=np.float32) for _ in sensor_clients]
+    logged_len = [0]*len(sensor_clients)
+
+    def make_callback(i):
+        def callback(data):
+            start = logged_len[i]
+            n = min(len(data), len(logged_t[i]) - start)
+            if n < len(data):
+                logger.warning(f'Log full for {supported_sensors[i][0].name}, dropping {len(data) - n} samples')
+            logged_t[i][start:start+n] = data[:n, 0]
+            logged_ibi[i][start:start+n] = data[:n, 1]
+            logged_len[i] = start + n
+        return callback
+
     for i, client in enumerate(sensor_clients):
         await client.connect()
-        await client.start_ibi_stream(logged_data[i].append)
+        await client.start_ibi_stream(make_callback(i))
 
     for t in tqdm.tqdm(range(record_len)):
         await asyncio.sleep(1)
 
     plt.figure(figsize=(12,6))
-    for i, d in enumerate(logged_data):
-        arr = np.array(d)
-        plt.plot(arr[:,0], np.round(60000/arr[:,1]), label=supported_sensors[i][0].name)
+    for i in range(len(sensor_clients)):
+        ts = logged_t[i][:logged_len[i]]
+        ibis = logged_ibi[i][:logged_len[i]]
+        plt.plot(ts, np.rint(60000 / ibis), label=supported_sensors[i][0].name)
 
     plt.legend()    
     plt.ylabel('Heart rate (bpm)')
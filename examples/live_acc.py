@@ -103,9 +103,9 @@ class DiceVisualizer(QMainWindow):
                 self.dice_group.addItem(pip)
 
     def update_dice_orientation(self, data):
-        _, x, y, z = data
+        # Only the latest sample is needed for orientation, viewed as [x, y, z] without copying
+        acc_vector = data[-1, 1:]
         # Normalize the acceleration vector
-        acc_vector = np.array([x, y, z])
         acc_vector = acc_vector / np.linalg.norm(acc_vector)
 
         # Calculate rotation from previous acceleration to current acceleration
@@ -37,7 +37,7 @@ class View(QChartView):
         self.start_series_update()
 
     def update_buffer(self, data):
-        self.buffer.append(data)
+        self.buffer.extend(data)
 
     def update_series(self):
         ''' Receives ecg data and updates the chart '''
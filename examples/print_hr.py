@@ -3,6 +3,7 @@ from bleak import BleakScanner, BLEDevice
 from blehrm import blehrm
 import sys
 from datetime import datetime
+import numpy as np
 import argparse
 
 # ADDRESS = "CF7582F0-5AA4-7279-63A3-5850A4B6F780" # CL800
@@ -29,12 +30,11 @@ async def main(use_mock = False):
         await asyncio.sleep(1)
 
 def print_callback(data):
-    if data.size > 0:
-        t, ibi = data
-        t_str = datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M:%S.%f")
-        hr = round(60000/ibi, 1)
+    hrs = np.round(60000/data[:, 1], 1)
+    for t, hr in zip(data[:, 0], hrs):
+        t_str = datetime.fromtimestamp(t).isoformat(sep=' ', timespec='milliseconds')
         sys.stdout.write(f"\r{t_str}: {hr} bpm")
-        sys.stdout.flush()
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Print heart rate data")